@@ -1,23 +1,19 @@
 """OpenAI Realtime Assistant Integration for Home Assistant."""
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.CONVERSATION]
+PLATFORMS = (Platform.CONVERSATION,)
 
-
-async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
-    """Set up the OpenAI Realtime Assistant component."""
-    # Configuration via YAML is deprecated, only config flow is supported
-    return True
+# Only config flow is supported; YAML configuration is rejected with a warning
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -5,6 +5,13 @@ from homeassistant.const import CONF_API_KEY
 
 from .const import DOMAIN, CONF_MODEL, CONF_VOICE, CONF_ENABLE_HOME_CONTROL, DEFAULT_MODEL, DEFAULT_VOICE
 
+STEP_USER_DATA_SCHEMA = vol.Schema({
+    vol.Required(CONF_API_KEY): str,
+    vol.Optional(CONF_MODEL, default=DEFAULT_MODEL): str,
+    vol.Optional(CONF_VOICE, default=DEFAULT_VOICE): str,
+    vol.Optional(CONF_ENABLE_HOME_CONTROL, default=True): bool,
+})
+
 
 class OpenAIRealtimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OpenAI Realtime Assistant."""
@@ -25,11 +32,6 @@ class OpenAIRealtimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_API_KEY): str,
-                vol.Optional(CONF_MODEL, default=DEFAULT_MODEL): str,
-                vol.Optional(CONF_VOICE, default=DEFAULT_VOICE): str,
-                vol.Optional(CONF_ENABLE_HOME_CONTROL, default=True): bool,
-            }),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
\ No newline at end of file
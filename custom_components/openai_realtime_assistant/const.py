@@ -3,6 +3,9 @@
 DOMAIN = "openai_realtime_assistant"
 VERSION = "1.0.0"
 
+# hass.data keys
+DATA_CLIENTS = "clients"
+
 # Configuration constants
 CONF_MODEL = "model"
 CONF_VOICE = "voice"
@@ -23,9 +26,10 @@ OPENAI_REALTIME_URL = "wss://api.openai.com/v1/realtime"
 AUDIO_FORMAT = "pcm16"
 SAMPLE_RATE = 16000
 CHANNELS = 1
+MAX_CONVERSATION_CONTEXT = 20
 
 # Voice options
-VOICE_OPTIONS = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+VOICE_OPTIONS = frozenset(("alloy", "echo", "fable", "onyx", "nova", "shimmer"))
 
 # WebSocket event types
 WS_EVENT_SESSION_CREATED = "session.created"
@@ -38,9 +42,11 @@ WS_EVENT_RESPONSE_CREATE = "response.create"
 WS_EVENT_RESPONSE_AUDIO_DELTA = "response.audio.delta"
 WS_EVENT_RESPONSE_TEXT_DELTA = "response.text.delta"
 WS_EVENT_RESPONSE_FUNCTION_CALL = "response.function_call_arguments"
+WS_EVENT_RESPONSE_DONE = "response.done"
 WS_EVENT_ERROR = "error"
 
 # Audio processing constants
 AUDIO_CHUNK_SIZE = 1024
 AUDIO_BUFFER_SIZE = 16384
+AUDIO_COMMIT_INTERVAL = 0.2  # seconds
 VAD_THRESHOLD = 0.5
\ No newline at end of file
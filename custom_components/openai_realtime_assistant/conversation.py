@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from functools import partial
 import logging
 from typing import Any, Literal
 
@@ -14,37 +14,99 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import intent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import ulid
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN, CONF_ENABLE_HOME_CONTROL, CONF_MODEL, CONF_VOICE, CONF_TEMPERATURE, CONF_SYSTEM_PROMPT
+from .const import DOMAIN, DATA_CLIENTS, CONF_ENABLE_HOME_CONTROL, CONF_MODEL, CONF_VOICE, CONF_TEMPERATURE, CONF_SYSTEM_PROMPT
+from .const import CONF_CONVERSATION_TIMEOUT
 from .const import DEFAULT_MODEL, DEFAULT_VOICE, DEFAULT_TEMPERATURE, DEFAULT_SYSTEM_PROMPT
+from .const import DEFAULT_CONVERSATION_TIMEOUT, WS_EVENT_CONVERSATION_ITEM_CREATE
 from .home_assistant_tools import HomeAssistantTools
 from .websocket_client import OpenAIRealtimeClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _function_call_output(call_id: str | None, output: str) -> dict[str, Any]:
+    """Build the message returning a function call result to OpenAI."""
+    return {
+        "type": WS_EVENT_CONVERSATION_ITEM_CREATE,
+        "item": {"type": "function_call_output", "call_id": call_id, "output": output},
+    }
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OpenAI Realtime conversation from a config entry."""
-    api_key = config_entry.data[CONF_API_KEY]
-    
-    # Create the websocket client
-    client = OpenAIRealtimeClient(
-        api_key=api_key,
-        model=config_entry.data.get(CONF_MODEL, DEFAULT_MODEL),
-        voice=config_entry.data.get(CONF_VOICE, DEFAULT_VOICE),
-        temperature=config_entry.data.get(CONF_TEMPERATURE, DEFAULT_TEMPERATURE),
-        system_prompt=config_entry.data.get(CONF_SYSTEM_PROMPT, DEFAULT_SYSTEM_PROMPT),
+    # Entries with identical session settings share one websocket client
+    key = _client_key(config_entry)
+    clients = hass.data[DOMAIN].setdefault(DATA_CLIENTS, {})
+    if key not in clients:
+        api_key, model, voice, temperature, system_prompt, _home_control = key
+        client = OpenAIRealtimeClient(
+            api_key=api_key,
+            model=model,
+            voice=voice,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+        clients[key] = (client, set())
+        
+    client, entry_ids = clients[key]
+    entry_ids.add(config_entry.entry_id)
+    # Tied to the entry, not the entity, which HA may remove and re-add
+    config_entry.async_on_unload(
+        partial(_async_release_client, hass, key, config_entry.entry_id)
     )
     
     # Create and add the conversation entity
     async_add_entities([OpenAIConversationEntity(config_entry, client)])
 
 
+def _client_key(entry: ConfigEntry) -> tuple[str, str, str, float, str, bool]:
+    """Return the session settings identifying a shareable client."""
+    # Tools are session state, so home control is part of the session too
+    return (
+        entry.data[CONF_API_KEY],
+        entry.data.get(CONF_MODEL, DEFAULT_MODEL),
+        entry.data.get(CONF_VOICE, DEFAULT_VOICE),
+        entry.data.get(CONF_TEMPERATURE, DEFAULT_TEMPERATURE),
+        entry.data.get(CONF_SYSTEM_PROMPT, DEFAULT_SYSTEM_PROMPT),
+        entry.data.get(CONF_ENABLE_HOME_CONTROL, True),
+    )
+
+
+async def _async_release_client(
+    hass: HomeAssistant, key: tuple[str, str, str, float, str, bool], entry_id: str
+) -> None:
+    """Release an entry's client, disconnecting it once no entry uses it."""
+    clients = hass.data[DOMAIN][DATA_CLIENTS]
+    client, entry_ids = clients[key]
+    entry_ids.discard(entry_id)
+    
+    if not entry_ids:
+        del clients[key]
+        # Also when not connected, to cancel a pending reconnect
+        await client.disconnect()
+
+
+class _TurnState:
+    """State of a single conversation turn."""
+
+    __slots__ = ("chunks", "text", "done", "timed_out")
+
+    def __init__(self) -> None:
+        """Initialize the turn."""
+        self.chunks: list[str] = []
+        self.text = ""
+        self.done = asyncio.Event()
+        self.timed_out = False
+
+
 class OpenAIConversationEntity(ConversationEntity):
     """OpenAI conversation entity."""
 
@@ -64,12 +126,14 @@ class OpenAIConversationEntity(ConversationEntity):
             "entry_type": "service",
         }
         
-        # Response tracking
-        self._response_text = ""
-        self._response_complete = asyncio.Event()
+        # State of the turn in progress, if any
+        self._turn: _TurnState | None = None
         
         # Initialize Home Assistant tools if enabled
         self.ha_tools = None
+        
+        # Background connection (and function calling setup)
+        self._connect_task: asyncio.Task | None = None
             
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -78,16 +142,23 @@ class OpenAIConversationEntity(ConversationEntity):
         # Initialize Home Assistant tools if enabled
         if self.entry.data.get(CONF_ENABLE_HOME_CONTROL, True):
             self.ha_tools = HomeAssistantTools(self.hass)
-            await self._setup_function_calling()
+        
+        # Register handlers once; events outside of a turn are dropped
+        self.client.on("text_delta", self._handle_text_delta)
+        self.client.on("response_done", self._handle_response_done)
+        self.client.on("function_call", self._handle_function_call)
+        
+        # Warm up the connection so the first turn doesn't pay for the handshake
+        self._async_start_connect()
         
         # Register this entity as a conversation agent
         conversation.async_set_agent(self.hass, self.entry, self)
             
     async def async_will_remove_from_hass(self) -> None:
         """When entity will be removed from hass."""
-        # Disconnect the client
-        if self.client.is_connected:
-            await self.client.disconnect()
+        self.client.off("text_delta", self._handle_text_delta)
+        self.client.off("response_done", self._handle_response_done)
+        self.client.off("function_call", self._handle_function_call)
             
         conversation.async_unset_agent(self.hass, self.entry)
         await super().async_will_remove_from_hass()
@@ -101,111 +172,124 @@ class OpenAIConversationEntity(ConversationEntity):
         self, user_input: ConversationInput
     ) -> ConversationResult:
         """Process a conversation input."""
-        try:
-            # Reset state
-            self._response_text = ""
-            self._response_complete.clear()
-            
-            # Ensure connection
-            if not self.client.is_connected:
-                await self.client.connect()
-                
-            # Register handlers
-            self.client.on("text_delta", self._handle_text_delta)
-            self.client.on("response_done", self._handle_response_done)
-            self.client.on("function_call", self._handle_function_call)
-            
-            # Send the user input
-            await self.client.send_text(user_input.text)
-            
-            # Wait for response
+        turn = _TurnState()
+        
+        # One response at a time per realtime session
+        async with self.client.response_lock:
             try:
-                await asyncio.wait_for(self._response_complete.wait(), timeout=30.0)
-            except asyncio.TimeoutError:
-                _LOGGER.warning("Response timeout")
-                self._response_text = "I'm sorry, I didn't get a response in time. Please try again."
+                # Ensure connection
+                await self._async_ensure_connected()
+                
+                self._turn = turn
                 
-            # Cleanup handlers
-            self.client.off("text_delta", self._handle_text_delta)
-            self.client.off("response_done", self._handle_response_done)
-            self.client.off("function_call", self._handle_function_call)
+                # Send the user input
+                await self.client.send_text(user_input.text)
+                
+                # Wait for response
+                timeout_handle = self.hass.loop.call_later(
+                    self.entry.data.get(CONF_CONVERSATION_TIMEOUT, DEFAULT_CONVERSATION_TIMEOUT),
+                    self._on_response_timeout,
+                    turn,
+                )
+                try:
+                    await turn.done.wait()
+                finally:
+                    timeout_handle.cancel()
+                    
+            except (TimeoutError, ConnectionError, HomeAssistantError) as err:
+                _LOGGER.exception("Conversation processing error")
+                response = intent.IntentResponse(language=user_input.language)
+                response.async_set_error(
+                    intent.IntentResponseErrorCode.UNKNOWN,
+                    f"An error occurred: {err}"
+                )
+                return ConversationResult(response=response)
+                
+            finally:
+                self._turn = None
+                
+        if turn.timed_out:
+            _LOGGER.warning("Response timeout")
+            turn.text = "I'm sorry, I didn't get a response in time. Please try again."
             
-            response = intent.IntentResponse(language=user_input.language)
-            response.async_set_speech(self._response_text)
+        response = intent.IntentResponse(language=user_input.language)
+        response.async_set_speech(turn.text)
+        
+        return ConversationResult(
+            response=response,
+            conversation_id=user_input.conversation_id or ulid.ulid(),
+        )
             
-            return ConversationResult(
-                response=response,
-                conversation_id=user_input.conversation_id or ulid.ulid(),
-            )
+    async def _async_ensure_connected(self) -> None:
+        """Wait for the background connection, restarting it if it dropped."""
+        if self._connect_task is None or (
+            self._connect_task.done() and not self.client.is_connected
+        ):
+            self._async_start_connect()
+        await self._connect_task
             
-        except Exception as e:
-            _LOGGER.error(f"Conversation processing error: {e}")
-            response = intent.IntentResponse(language=user_input.language)
-            response.async_set_error(
-                intent.IntentResponseErrorCode.UNKNOWN,
-                f"An error occurred: {str(e)}"
-            )
-            return ConversationResult(response=response)
+    def _async_start_connect(self) -> None:
+        """Connect in the background; cancelled when the entry unloads."""
+        self._connect_task = self.entry.async_create_background_task(
+            self.hass, self._async_connect(), f"{DOMAIN}_connect_{self.entry.entry_id}"
+        )
+            
+    async def _async_connect(self) -> None:
+        """Connect the client and set up function calling."""
+        # Tools set before connecting go out with the initial session config
+        if self.ha_tools:
+            await self.client.update_tools(self.ha_tools.get_available_tools())
             
-    async def _setup_function_calling(self) -> None:
-        """Set up function calling for Home Assistant control."""
-        # Update the client session with available tools
-        tools = self.ha_tools.get_available_tools()
-        
         if not self.client.is_connected:
             await self.client.connect()
             
-        await self.client.send_message({
-            "type": "session.update",
-            "session": {
-                "tools": tools,
-                "tool_choice": "auto"
-            }
-        })
-            
+    @staticmethod
+    def _on_response_timeout(turn: _TurnState) -> None:
+        """Stop waiting for a response that took too long."""
+        turn.timed_out = True
+        turn.done.set()
+        
     def _handle_text_delta(self, text_delta: str) -> None:
         """Handle text delta from OpenAI."""
-        self._response_text += text_delta
+        if (turn := self._turn) is None:
+            return
+        turn.chunks.append(text_delta)
         
     def _handle_response_done(self, data: dict) -> None:
         """Handle response completion."""
-        if "text" in data:
-            self._response_text = data["text"]
-        self._response_complete.set()
+        if (turn := self._turn) is None:
+            return
+        turn.text = data.get("text") or "".join(turn.chunks)
+        turn.done.set()
         
-    async def _handle_function_call(self, data: dict) -> None:
+    def _handle_function_call(self, data: dict) -> None:
         """Handle function calls for Home Assistant control."""
-        if not self.ha_tools:
+        if not self.ha_tools or self._turn is None:
             return
             
+        # Run in the background so the client keeps dispatching events
+        self.hass.async_create_task(self._async_run_function_call(data))
+        
+    async def _async_run_function_call(self, data: dict) -> None:
+        """Execute a function call and send the result back to OpenAI."""
         try:
             function_name = data.get("name")
-            function_args = json.loads(data.get("arguments", "{}"))
+            function_args = json_loads(data.get("arguments") or "{}")
             
-            _LOGGER.debug(f"Function call: {function_name} with args: {function_args}")
+            _LOGGER.debug("Function call: %s with args: %s", function_name, function_args)
             
             # Execute the function
             result = await self.ha_tools.execute_function(function_name, function_args)
             
             # Send the result back to OpenAI
-            await self.client.send_message({
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "function_call_output",
-                    "call_id": data.get("call_id"),
-                    "output": json.dumps(result)
-                }
-            })
+            await self.client.send_message(
+                _function_call_output(data.get("call_id"), json_dumps(result))
+            )
             
         except Exception as e:
-            _LOGGER.error(f"Function call error: {e}")
+            _LOGGER.error("Function call error: %s", e)
             
             # Send error back to OpenAI
-            await self.client.send_message({
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "function_call_output",
-                    "call_id": data.get("call_id"),
-                    "output": json.dumps({"error": str(e)})
-                }
-            })
\ No newline at end of file
+            await self.client.send_message(
+                _function_call_output(data.get("call_id"), json_dumps({"error": str(e)}))
+            )
\ No newline at end of file
@@ -9,200 +9,227 @@ from homeassistant.helpers import area_registry as ar
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class HomeAssistantTools:
-    """Tools for controlling Home Assistant via function calls."""
-    
-    def __init__(self, hass: HomeAssistant):
-        """Initialize the tools."""
-        self.hass = hass
-        self.entity_registry = er.async_get(hass)
-        self.device_registry = dr.async_get(hass)
-        self.area_registry = ar.async_get(hass)
-        
-    def get_available_tools(self) -> list[dict]:
-        """Get the list of available tools for OpenAI."""
-        return [
-            {
-                "type": "function",
-                "name": "turn_on",
-                "description": "Turn on a device or entity",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The entity ID to turn on (e.g., light.living_room)"
-                        }
-                    },
-                    "required": ["entity_id"]
+# Function definitions sent to OpenAI; static, so built once and shared
+TOOLS = (
+    {
+        "type": "function",
+        "name": "turn_on",
+        "description": "Turn on a device or entity",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The entity ID to turn on (e.g., light.living_room)"
                 }
             },
-            {
-                "type": "function",
-                "name": "turn_off",
-                "description": "Turn off a device or entity",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The entity ID to turn off"
-                        }
-                    },
-                    "required": ["entity_id"]
+            "required": ["entity_id"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "turn_off",
+        "description": "Turn off a device or entity",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The entity ID to turn off"
                 }
             },
-            {
-                "type": "function",
-                "name": "toggle",
-                "description": "Toggle a device or entity",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The entity ID to toggle"
-                        }
-                    },
-                    "required": ["entity_id"]
+            "required": ["entity_id"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "toggle",
+        "description": "Toggle a device or entity",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The entity ID to toggle"
                 }
             },
-            {
-                "type": "function",
-                "name": "set_light_brightness",
-                "description": "Set the brightness of a light",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The light entity ID"
-                        },
-                        "brightness": {
-                            "type": "integer",
-                            "description": "Brightness level (0-255)",
-                            "minimum": 0,
-                            "maximum": 255
-                        }
-                    },
-                    "required": ["entity_id", "brightness"]
+            "required": ["entity_id"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "set_light_brightness",
+        "description": "Set the brightness of a light",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The light entity ID"
+                },
+                "brightness": {
+                    "type": "integer",
+                    "description": "Brightness level (0-255)",
+                    "minimum": 0,
+                    "maximum": 255
                 }
             },
-            {
-                "type": "function",
-                "name": "set_light_color",
-                "description": "Set the color of a light",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The light entity ID"
-                        },
-                        "rgb_color": {
-                            "type": "array",
-                            "items": {"type": "integer"},
-                            "description": "RGB color values [red, green, blue]"
-                        }
-                    },
-                    "required": ["entity_id", "rgb_color"]
+            "required": ["entity_id", "brightness"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "set_light_color",
+        "description": "Set the color of a light",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The light entity ID"
+                },
+                "rgb_color": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "RGB color values [red, green, blue]"
                 }
             },
-            {
-                "type": "function",
-                "name": "activate_scene",
-                "description": "Activate a scene",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The scene entity ID (e.g., scene.movie_time)"
-                        }
-                    },
-                    "required": ["entity_id"]
+            "required": ["entity_id", "rgb_color"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "activate_scene",
+        "description": "Activate a scene",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The scene entity ID (e.g., scene.movie_time)"
                 }
             },
-            {
-                "type": "function",
-                "name": "set_climate_temperature",
-                "description": "Set the temperature for a climate device",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The climate entity ID"
-                        },
-                        "temperature": {
-                            "type": "number",
-                            "description": "Target temperature"
-                        }
-                    },
-                    "required": ["entity_id", "temperature"]
+            "required": ["entity_id"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "set_climate_temperature",
+        "description": "Set the temperature for a climate device",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The climate entity ID"
+                },
+                "temperature": {
+                    "type": "number",
+                    "description": "Target temperature"
                 }
             },
-            {
-                "type": "function",
-                "name": "get_entity_state",
-                "description": "Get the current state of an entity",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "entity_id": {
-                            "type": "string",
-                            "description": "The entity ID to query"
-                        }
-                    },
-                    "required": ["entity_id"]
+            "required": ["entity_id", "temperature"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "get_entity_state",
+        "description": "Get the current state of an entity",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entity_id": {
+                    "type": "string",
+                    "description": "The entity ID to query"
                 }
             },
-            {
-                "type": "function",
-                "name": "list_entities",
-                "description": "List entities by domain or area",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "Entity domain (e.g., light, switch, climate)"
-                        },
-                        "area": {
-                            "type": "string",
-                            "description": "Area name"
-                        }
-                    }
+            "required": ["entity_id"]
+        }
+    },
+    {
+        "type": "function",
+        "name": "list_entities",
+        "description": "List entities by domain or area",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "Entity domain (e.g., light, switch, climate)"
+                },
+                "area": {
+                    "type": "string",
+                    "description": "Area name"
                 }
             }
+        }
+    },
+)
+
+
+class HomeAssistantTools:
+    """Tools for controlling Home Assistant via function calls."""
+    
+    __slots__ = (
+        "hass",
+        "entity_registry",
+        "device_registry",
+        "area_registry",
+    )
+    
+    # Function name to handler; handler parameters match the tool schema
+    _DISPATCH = {
+        "turn_on": "_turn_on",
+        "turn_off": "_turn_off",
+        "toggle": "_toggle",
+        "set_light_brightness": "_set_light_brightness",
+        "set_light_color": "_set_light_color",
+        "activate_scene": "_activate_scene",
+        "set_climate_temperature": "_set_climate_temperature",
+        "get_entity_state": "_get_entity_state",
+        "list_entities": "_list_entities",
+    }
+    
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the tools."""
+        self.hass = hass
+        self.entity_registry = er.async_get(hass)
+        self.device_registry = dr.async_get(hass)
+        self.area_registry = ar.async_get(hass)
+        
+    def _area_entity_ids(self, area: str) -> list[str]:
+        """Return the entity IDs in an area, using the device area as fallback."""
+        if (area_entry := self.area_registry.async_get_area_by_name(area)) is None:
+            return []
+            
+        entity_ids = [
+            entity_entry.entity_id
+            for entity_entry in er.async_entries_for_area(self.entity_registry, area_entry.id)
         ]
+        for device_entry in dr.async_entries_for_area(self.device_registry, area_entry.id):
+            entity_ids.extend(
+                entity_entry.entity_id
+                for entity_entry in er.async_entries_for_device(
+                    self.entity_registry, device_entry.id
+                )
+                if entity_entry.area_id is None
+            )
+        return entity_ids
+        
+    def get_available_tools(self) -> tuple[dict, ...]:
+        """Get the list of available tools for OpenAI."""
+        return TOOLS
         
     async def execute_function(self, function_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a function with the given arguments."""
+        handler_name = self._DISPATCH.get(function_name)
+        if handler_name is None:
+            return {"error": f"Unknown function: {function_name}"}
+            
         try:
-            if function_name == "turn_on":
-                return await self._turn_on(args["entity_id"])
-            elif function_name == "turn_off":
-                return await self._turn_off(args["entity_id"])
-            elif function_name == "toggle":
-                return await self._toggle(args["entity_id"])
-            elif function_name == "set_light_brightness":
-                return await self._set_light_brightness(args["entity_id"], args["brightness"])
-            elif function_name == "set_light_color":
-                return await self._set_light_color(args["entity_id"], args["rgb_color"])
-            elif function_name == "activate_scene":
-                return await self._activate_scene(args["entity_id"])
-            elif function_name == "set_climate_temperature":
-                return await self._set_climate_temperature(args["entity_id"], args["temperature"])
-            elif function_name == "get_entity_state":
-                return await self._get_entity_state(args["entity_id"])
-            elif function_name == "list_entities":
-                return await self._list_entities(args.get("domain"), args.get("area"))
-            else:
-                return {"error": f"Unknown function: {function_name}"}
+            return await getattr(self, handler_name)(**args)
         except Exception as e:
-            _LOGGER.error(f"Error executing function {function_name}: {e}")
+            _LOGGER.error("Error executing function %s: %s", function_name, e)
             return {"error": str(e)}
             
     async def _turn_on(self, entity_id: str) -> Dict[str, Any]:
@@ -261,7 +288,7 @@ class HomeAssistantTools:
             return {
                 "entity_id": entity_id,
                 "state": state.state,
-                "attributes": dict(state.attributes),
+                "attributes": state.attributes,
                 "last_changed": state.last_changed.isoformat(),
                 "last_updated": state.last_updated.isoformat()
             }
@@ -272,19 +299,19 @@ class HomeAssistantTools:
         """List entities by domain or area."""
         entities = []
         
-        for state in self.hass.states.async_all():
-            if domain and not state.entity_id.startswith(f"{domain}."):
-                continue
-                
-            entity_entry = self.entity_registry.async_get(state.entity_id)
-            if area and entity_entry:
-                if entity_entry.area_id:
-                    area_entry = self.area_registry.async_get_area(entity_entry.area_id)
-                    if area_entry and area_entry.name.lower() != area.lower():
-                        continue
-                else:
-                    continue
-                    
+        if area:
+            prefix = f"{domain}." if domain else ""
+            states = [
+                state
+                for entity_id in self._area_entity_ids(area)
+                if entity_id.startswith(prefix)
+                and (state := self.hass.states.get(entity_id)) is not None
+            ]
+        else:
+            # The state machine indexes states by domain
+            states = self.hass.states.async_all(domain)
+            
+        for state in states:
             entities.append({
                 "entity_id": state.entity_id,
                 "state": state.state,
@@ -5,10 +5,10 @@ from typing import Any
 
 from homeassistant.components.stt import Provider, SpeechMetadata, SpeechResult, SpeechResultState
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, AUDIO_FORMAT, SAMPLE_RATE
+from .const import DOMAIN, AUDIO_FORMAT, SAMPLE_RATE, AUDIO_BUFFER_SIZE, AUDIO_COMMIT_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,7 +20,9 @@ async def async_setup_entry(
 ) -> None:
     """Set up OpenAI Realtime STT from a config entry."""
     client = hass.data[DOMAIN]["client"]
-    async_add_entities([OpenAIRealtimeSTTProvider(client)])
+    provider = OpenAIRealtimeSTTProvider(client)
+    config_entry.async_on_unload(provider.async_unload)
+    async_add_entities([provider])
 
 
 class OpenAIRealtimeSTTProvider(Provider):
@@ -29,9 +31,15 @@ class OpenAIRealtimeSTTProvider(Provider):
     def __init__(self, client):
         """Initialize the provider."""
         self.client = client
+        self._active = False
+        self._transcript_parts: list[str] = []
         self._transcript = ""
         self._transcription_complete = asyncio.Event()
         
+        # Register handlers once; events outside of a transcription are dropped
+        self.client.on("text_delta", self._handle_text_delta)
+        self.client.on("response_done", self._handle_response_done)
+        
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
@@ -53,48 +61,51 @@ class OpenAIRealtimeSTTProvider(Provider):
     ) -> SpeechResult:
         """Process an audio stream and return the transcription."""
         try:
-            # Reset state
-            self._transcript = ""
-            self._transcription_complete.clear()
-            
-            # Ensure connection
-            if not self.client.is_connected:
-                await self.client.connect()
+            # One response at a time per realtime session
+            async with self.client.response_lock:
+                # Reset state
+                self._transcript_parts.clear()
+                self._transcript = ""
+                self._transcription_complete.clear()
                 
-            # Register handlers
-            self.client.on("text_delta", self._handle_text_delta)
-            self.client.on("response_done", self._handle_response_done)
-            
-            # Clear any existing audio buffer
-            await self.client.clear_audio_buffer()
-            
-            # Stream audio to OpenAI
-            chunk_count = 0
-            while True:
-                chunk = await stream.read(1024)
-                if not chunk:
-                    break
+                # Ensure connection
+                if not self.client.is_connected:
+                    await self.client.connect()
                     
-                await self.client.send_audio(chunk)
-                chunk_count += 1
-                
-                # Commit audio periodically for better real-time performance
-                if chunk_count % 10 == 0:
+                self._active = True
+                try:
+                    # Clear any existing audio buffer
+                    await self.client.clear_audio_buffer()
+                    
+                    # Stream audio to OpenAI
+                    loop = asyncio.get_running_loop()
+                    last_commit = loop.time()
+                    while True:
+                        chunk = await stream.read(AUDIO_BUFFER_SIZE)
+                        if not chunk:
+                            break
+                            
+                        await self.client.send_audio(chunk)
+                        
+                        # Commit audio periodically for better real-time performance
+                        now = loop.time()
+                        if now - last_commit >= AUDIO_COMMIT_INTERVAL:
+                            await self.client.commit_audio()
+                            last_commit = now
+                            
+                    # Commit final audio
                     await self.client.commit_audio()
                     
-            # Commit final audio
-            await self.client.commit_audio()
-            
-            # Wait for transcription to complete
-            try:
-                await asyncio.wait_for(self._transcription_complete.wait(), timeout=10.0)
-            except asyncio.TimeoutError:
-                _LOGGER.warning("Transcription timeout")
-                
-            # Cleanup handlers
-            self.client.off("text_delta", self._handle_text_delta)
-            self.client.off("response_done", self._handle_response_done)
-            
+                    # Wait for transcription to complete
+                    try:
+                        async with asyncio.timeout(10.0):
+                            await self._transcription_complete.wait()
+                    except asyncio.TimeoutError:
+                        _LOGGER.warning("Transcription timeout")
+                        self._transcript = "".join(self._transcript_parts)
+                finally:
+                    self._active = False
+                    
             if self._transcript:
                 return SpeechResult(
                     text=self._transcript,
@@ -107,19 +118,28 @@ class OpenAIRealtimeSTTProvider(Provider):
                 )
                 
         except Exception as e:
-            _LOGGER.error(f"STT processing error: {e}")
+            _LOGGER.error("STT processing error: %s", e)
             return SpeechResult(
                 text="",
                 result=SpeechResultState.ERROR,
             )
             
+    @callback
+    def async_unload(self) -> None:
+        """Unregister the client event handlers."""
+        self.client.off("text_delta", self._handle_text_delta)
+        self.client.off("response_done", self._handle_response_done)
+        
     def _handle_text_delta(self, text_delta: str) -> None:
         """Handle text delta from OpenAI."""
-        self._transcript += text_delta
+        if not self._active:
+            return
+        self._transcript_parts.append(text_delta)
         
     def _handle_response_done(self, data: dict) -> None:
         """Handle response completion."""
-        # Extract final transcript if available
-        if "text" in data:
-            self._transcript = data["text"]
+        if not self._active:
+            return
+        # Prefer the final transcript, fall back to the streamed deltas
+        self._transcript = data.get("text") or "".join(self._transcript_parts)
         self._transcription_complete.set()
\ No newline at end of file
@@ -2,17 +2,35 @@
 import asyncio
 import io
 import logging
+import struct
 from typing import Any
 
 from homeassistant.components.tts import Provider, TtsAudioType
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, AUDIO_FORMAT, SAMPLE_RATE, CONF_VOICE
+from .const import DOMAIN, AUDIO_FORMAT, SAMPLE_RATE, CHANNELS, CONF_VOICE
 
 _LOGGER = logging.getLogger(__name__)
 
+_SAMPLE_WIDTH = 2  # 16-bit
+
+# 44-byte PCM WAV header with zeroed RIFF and data chunk sizes
+_WAV_HEADER_TEMPLATE = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0, b'WAVE',
+    b'fmt ',
+    16,  # Chunk size
+    1,  # PCM format
+    CHANNELS,
+    SAMPLE_RATE,
+    SAMPLE_RATE * CHANNELS * _SAMPLE_WIDTH,
+    CHANNELS * _SAMPLE_WIDTH,
+    _SAMPLE_WIDTH * 8,
+    b'data', 0,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,7 +40,9 @@ async def async_setup_entry(
     """Set up OpenAI Realtime TTS from a config entry."""
     client = hass.data[DOMAIN]["client"]
     config = hass.data[DOMAIN]["config"]
-    async_add_entities([OpenAIRealtimeTTSProvider(client, config)])
+    provider = OpenAIRealtimeTTSProvider(client, config)
+    config_entry.async_on_unload(provider.async_unload)
+    async_add_entities([provider])
 
 
 class OpenAIRealtimeTTSProvider(Provider):
@@ -32,9 +52,15 @@ class OpenAIRealtimeTTSProvider(Provider):
         """Initialize the provider."""
         self.client = client
         self.config = config
-        self._audio_data = bytearray()
+        self._active = False
+        self._audio_chunks: list[bytes] = []
+        self._audio_len = 0
         self._audio_complete = asyncio.Event()
         
+        # Register handlers once; events outside of a TTS request are dropped
+        self.client.on("audio_delta", self._handle_audio_delta)
+        self.client.on("response_done", self._handle_response_done)
+        
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
@@ -56,120 +82,84 @@ class OpenAIRealtimeTTSProvider(Provider):
     ) -> TtsAudioType:
         """Generate TTS audio from text."""
         try:
-            # Reset state
-            self._audio_data.clear()
-            self._audio_complete.clear()
-            
             # Get voice from options or config
             voice = self.config.get(CONF_VOICE, "alloy")
             if options and "voice" in options:
                 voice = options["voice"]
                 
-            # Ensure connection
-            if not self.client.is_connected:
-                await self.client.connect()
-                
-            # Update voice if different
-            if voice != self.client.voice:
-                self.client.voice = voice
-                await self.client._configure_session()
+            # One response at a time per realtime session
+            async with self.client.response_lock:
+                # Reset state
+                self._audio_chunks.clear()
+                self._audio_len = 0
+                self._audio_complete.clear()
                 
-            # Register handlers
-            self.client.on("audio_delta", self._handle_audio_delta)
-            self.client.on("response_done", self._handle_response_done)
-            
-            # Send text for TTS
-            await self.client.send_message({
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "assistant",
-                    "content": [
-                        {
-                            "type": "audio",
-                            "transcript": message
+                # Ensure connection
+                if not self.client.is_connected:
+                    await self.client.connect()
+                    
+                # Update voice if different
+                if voice != self.client.voice:
+                    self.client.voice = voice
+                    await self.client._configure_session()
+                    
+                self._active = True
+                try:
+                    # Trigger audio generation
+                    await self.client.send_message({
+                        "type": "response.create",
+                        "response": {
+                            "modalities": ["audio"],
+                            "instructions": f"Read this text aloud: {message}"
                         }
-                    ]
-                }
-            })
-            
-            # Trigger audio generation
-            await self.client.send_message({
-                "type": "response.create",
-                "response": {
-                    "modalities": ["audio"],
-                    "instructions": f"Read this text aloud: {message}"
-                }
-            })
-            
-            # Wait for audio to complete
-            try:
-                await asyncio.wait_for(self._audio_complete.wait(), timeout=30.0)
-            except asyncio.TimeoutError:
-                _LOGGER.warning("TTS generation timeout")
-                
-            # Cleanup handlers
-            self.client.off("audio_delta", self._handle_audio_delta)
-            self.client.off("response_done", self._handle_response_done)
-            
-            if self._audio_data:
-                # Convert PCM to WAV format
-                wav_data = self._create_wav_header(self._audio_data) + self._audio_data
+                    })
+                    
+                    # Wait for audio to complete
+                    try:
+                        async with asyncio.timeout(30.0):
+                            await self._audio_complete.wait()
+                    except asyncio.TimeoutError:
+                        _LOGGER.warning("TTS generation timeout")
+                finally:
+                    self._active = False
+                    
+            if self._audio_len:
+                # Convert PCM to WAV format, copying the PCM only once
                 return (
                     "wav",
-                    bytes(wav_data)
+                    b"".join((self._create_wav_header(self._audio_len), *self._audio_chunks))
                 )
             else:
                 raise Exception("No audio data received")
                 
         except Exception as e:
-            _LOGGER.error(f"TTS generation error: {e}")
+            _LOGGER.error("TTS generation error: %s", e)
             raise
             
+    @callback
+    def async_unload(self) -> None:
+        """Unregister the client event handlers."""
+        self.client.off("audio_delta", self._handle_audio_delta)
+        self.client.off("response_done", self._handle_response_done)
+        
     def _handle_audio_delta(self, audio_chunk: bytes) -> None:
         """Handle audio delta from OpenAI."""
-        self._audio_data.extend(audio_chunk)
+        if not self._active:
+            return
+        self._audio_chunks.append(audio_chunk)
+        self._audio_len += len(audio_chunk)
         
     def _handle_response_done(self, data: dict) -> None:
         """Handle response completion."""
-        if "audio" in data:
-            # If final audio is provided, use it
-            self._audio_data = bytearray(data["audio"])
+        if not self._active:
+            return
         self._audio_complete.set()
         
-    def _create_wav_header(self, pcm_data: bytearray) -> bytes:
-        """Create WAV header for PCM data."""
-        import struct
-        
-        # WAV header parameters
-        channels = 1
-        sample_width = 2  # 16-bit
-        framerate = SAMPLE_RATE
-        
-        # Calculate sizes
-        data_size = len(pcm_data)
-        file_size = data_size + 36
-        
-        # Create header
-        header = bytearray()
-        
-        # RIFF chunk
-        header.extend(b'RIFF')
-        header.extend(struct.pack('<I', file_size))
-        header.extend(b'WAVE')
-        
-        # fmt chunk
-        header.extend(b'fmt ')
-        header.extend(struct.pack('<I', 16))  # Chunk size
-        header.extend(struct.pack('<H', 1))   # PCM format
-        header.extend(struct.pack('<H', channels))
-        header.extend(struct.pack('<I', framerate))
-        header.extend(struct.pack('<I', framerate * channels * sample_width))
-        header.extend(struct.pack('<H', channels * sample_width))
-        header.extend(struct.pack('<H', sample_width * 8))
-        
-        # data chunk
-        header.extend(b'data')
-        header.extend(struct.pack('<I', data_size))
+    def _create_wav_header(self, data_size: int) -> bytes:
+        """Create WAV header for PCM data of the given size."""
+        # Only the RIFF and data chunk sizes vary
+        header = bytearray(_WAV_HEADER_TEMPLATE)
+        struct.pack_into('<I', header, 4, data_size + 36)
+        struct.pack_into('<I', header, 40, data_size)
         
-        return bytes(header)
\ No newline at end of file
+        return bytes(header)
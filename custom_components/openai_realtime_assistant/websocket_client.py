@@ -1,15 +1,19 @@
 """WebSocket client for OpenAI Realtime API."""
 import asyncio
 import base64
-import json
+import binascii
 import logging
-from typing import Any, Callable, Optional
+import random
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
 import aiohttp
+import orjson
 import websockets
 from websockets.exceptions import WebSocketException
 
 from .const import (
     OPENAI_REALTIME_URL,
+    MAX_CONVERSATION_CONTEXT,
     AUDIO_FORMAT,
     SAMPLE_RATE,
     WS_EVENT_SESSION_CREATED,
@@ -22,11 +26,16 @@ from .const import (
     WS_EVENT_RESPONSE_AUDIO_DELTA,
     WS_EVENT_RESPONSE_TEXT_DELTA,
     WS_EVENT_RESPONSE_FUNCTION_CALL,
+    WS_EVENT_RESPONSE_DONE,
     WS_EVENT_ERROR,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Found near the start of audio delta frames, which carry large base64 payloads
+_AUDIO_DELTA_MARKER = f'"type":"{WS_EVENT_RESPONSE_AUDIO_DELTA}"'
+_AUDIO_DELTA_MARKER_SCAN = 128
+
 
 class OpenAIRealtimeClient:
     """WebSocket client for OpenAI Realtime API."""
@@ -45,17 +54,36 @@ class OpenAIRealtimeClient:
         self.voice = voice
         self.temperature = temperature
         self.system_prompt = system_prompt
+        self.tools: tuple[dict, ...] = ()
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.session_id: Optional[str] = None
         self.is_connected = False
-        self._audio_buffer = bytearray()
-        self._text_buffer = ""
+        self._text_parts: list[str] = []
         self._reconnect_task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        # Held by callers for a request/response exchange on the session
+        self.response_lock = asyncio.Lock()
         self._message_handlers: dict[str, list[Callable]] = {}
-        self._conversation_context = []
+        self._handler_tasks: set[asyncio.Task] = set()
+        self._conversation_context: deque[tuple[str, str]] = deque(maxlen=MAX_CONVERSATION_CONTEXT)
+        self._event_dispatch: dict[str, Callable[[dict], Awaitable[None]]] = {
+            WS_EVENT_SESSION_CREATED: self._on_session_created,
+            WS_EVENT_SESSION_UPDATED: self._on_session_updated,
+            WS_EVENT_RESPONSE_AUDIO_DELTA: self._on_audio_delta,
+            WS_EVENT_RESPONSE_TEXT_DELTA: self._on_text_delta,
+            WS_EVENT_RESPONSE_FUNCTION_CALL: self._on_function_call,
+            WS_EVENT_ERROR: self._on_error,
+            WS_EVENT_RESPONSE_DONE: self._on_response_done,
+        }
         
     def on(self, event_type: str, handler: Callable) -> None:
-        """Register an event handler."""
+        """Register an event handler.
+        
+        Plain callbacks run in order with the read loop. Coroutine handlers
+        run as separate tasks and are unordered relative to other events, so
+        use a callback where order matters (e.g. deltas before response_done).
+        """
         if event_type not in self._message_handlers:
             self._message_handlers[event_type] = []
         self._message_handlers[event_type].append(handler)
@@ -67,16 +95,39 @@ class OpenAIRealtimeClient:
             
     async def _emit(self, event_type: str, data: Any) -> None:
         """Emit an event to all registered handlers."""
-        if event_type in self._message_handlers:
-            for handler in self._message_handlers[event_type]:
-                try:
-                    await handler(data) if asyncio.iscoroutinefunction(handler) else handler(data)
-                except Exception as e:
-                    _LOGGER.error(f"Error in event handler for {event_type}: {e}")
+        for handler in self._message_handlers.get(event_type, ()):
+            if asyncio.iscoroutinefunction(handler):
+                # Run in a task so a slow handler can't stall the read loop
+                task = asyncio.create_task(self._run_handler(event_type, handler, data))
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._handler_tasks.discard)
+                continue
+                
+            try:
+                handler(data)
+            except Exception as e:
+                _LOGGER.error("Error in event handler for %s: %s", event_type, e)
+                
+    async def _run_handler(self, event_type: str, handler: Callable, data: Any) -> None:
+        """Run a coroutine event handler, logging any error."""
+        try:
+            await handler(data)
+        except Exception as e:
+            _LOGGER.error("Error in event handler for %s: %s", event_type, e)
 
     async def connect(self) -> None:
         """Connect to OpenAI Realtime API."""
+        async with self._connect_lock:
+            if self.is_connected:
+                return
+            await self._connect()
+            
+    async def _connect(self) -> None:
+        """Open the websocket and configure the session."""
         try:
+            # Don't leave the previous socket and its listen loop running
+            await self._close_socket()
+            
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "OpenAI-Beta": "realtime=v1",
@@ -85,21 +136,30 @@ class OpenAIRealtimeClient:
             self.websocket = await websockets.connect(
                 OPENAI_REALTIME_URL,
                 extra_headers=headers,
-                ping_interval=20,
-                ping_timeout=10,
+                # Notice dead connections quickly so reconnect can kick in
+                ping_interval=10,
+                ping_timeout=5,
+                close_timeout=2,
+                max_size=2**22,
+                # Base64 audio doesn't deflate well; skip the compression CPU
+                compression=None,
             )
             
             self.is_connected = True
             _LOGGER.info("Connected to OpenAI Realtime API")
             
+            # A response cut off by a dropped connection never gets its
+            # response.done; don't carry its text into the new session
+            self._text_parts.clear()
+            
             # Start message handler
-            asyncio.create_task(self._handle_messages())
+            self._listen_task = asyncio.create_task(self._handle_messages())
             
             # Configure session
             await self._configure_session()
             
         except Exception as e:
-            _LOGGER.error(f"Failed to connect: {e}")
+            _LOGGER.error("Failed to connect: %s", e)
             self.is_connected = False
             await self._schedule_reconnect()
             
@@ -110,11 +170,23 @@ class OpenAIRealtimeClient:
         if self._reconnect_task:
             self._reconnect_task.cancel()
             
+        await self._close_socket()
+        
+        # Coroutine handlers don't outlive the client
+        for task in self._handler_tasks:
+            task.cancel()
+        
+        _LOGGER.info("Disconnected from OpenAI Realtime API")
+        
+    async def _close_socket(self) -> None:
+        """Stop the listen loop and close the websocket, if any."""
+        if self._listen_task:
+            self._listen_task.cancel()
+            self._listen_task = None
+            
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
-            
-        _LOGGER.info("Disconnected from OpenAI Realtime API")
         
     async def _configure_session(self) -> None:
         """Configure the session with model parameters."""
@@ -136,7 +208,7 @@ class OpenAIRealtimeClient:
                     "prefix_padding_ms": 300,
                     "silence_duration_ms": 500
                 },
-                "tools": [],
+                "tools": self.tools,
                 "tool_choice": "auto",
                 "temperature": self.temperature,
             }
@@ -148,64 +220,86 @@ class OpenAIRealtimeClient:
         """Handle incoming WebSocket messages."""
         try:
             async for message in self.websocket:
-                data = json.loads(message)
+                # Skip parsing audio deltas nobody is listening for
+                if (
+                    isinstance(message, str)
+                    and not self._message_handlers.get("audio_delta")
+                    and _AUDIO_DELTA_MARKER in message[:_AUDIO_DELTA_MARKER_SCAN]
+                ):
+                    continue
+                    
+                data = orjson.loads(message)
                 event_type = data.get("type")
                 
-                _LOGGER.debug(f"Received event: {event_type}")
+                _LOGGER.debug("Received event: %s", event_type)
                 
-                if event_type == WS_EVENT_SESSION_CREATED:
-                    self.session_id = data.get("session", {}).get("id")
-                    await self._emit("session_created", data)
-                    
-                elif event_type == WS_EVENT_SESSION_UPDATED:
-                    await self._emit("session_updated", data)
-                    
-                elif event_type == WS_EVENT_RESPONSE_AUDIO_DELTA:
-                    audio_data = base64.b64decode(data.get("delta", ""))
-                    await self._emit("audio_delta", audio_data)
-                    
-                elif event_type == WS_EVENT_RESPONSE_TEXT_DELTA:
-                    text_delta = data.get("delta", "")
-                    self._text_buffer += text_delta
-                    await self._emit("text_delta", text_delta)
-                    
-                elif event_type == WS_EVENT_RESPONSE_FUNCTION_CALL:
-                    await self._emit("function_call", data)
-                    
-                elif event_type == WS_EVENT_ERROR:
-                    _LOGGER.error(f"API Error: {data}")
-                    await self._emit("error", data)
-                    
-                elif event_type == "response.done":
-                    await self._emit("response_done", {
-                        "text": self._text_buffer,
-                        "audio": bytes(self._audio_buffer)
-                    })
-                    self._text_buffer = ""
-                    self._audio_buffer.clear()
+                handler = self._event_dispatch.get(event_type)
+                if handler:
+                    await handler(data)
                     
         except WebSocketException as e:
-            _LOGGER.error(f"WebSocket error: {e}")
+            _LOGGER.error("WebSocket error: %s", e)
+            self.is_connected = False
             await self._schedule_reconnect()
         except Exception as e:
-            _LOGGER.error(f"Message handler error: {e}")
+            _LOGGER.error("Message handler error: %s", e)
             
+    async def _on_session_created(self, data: dict) -> None:
+        """Handle session.created."""
+        self.session_id = data.get("session", {}).get("id")
+        await self._emit("session_created", data)
+        
+    async def _on_session_updated(self, data: dict) -> None:
+        """Handle session.updated."""
+        await self._emit("session_updated", data)
+        
+    async def _on_audio_delta(self, data: dict) -> None:
+        """Handle response.audio.delta."""
+        audio_data = base64.b64decode(data.get("delta", ""))
+        await self._emit("audio_delta", audio_data)
+        
+    async def _on_text_delta(self, data: dict) -> None:
+        """Handle response.text.delta."""
+        text_delta = data.get("delta", "")
+        self._text_parts.append(text_delta)
+        await self._emit("text_delta", text_delta)
+        
+    async def _on_function_call(self, data: dict) -> None:
+        """Handle response.function_call_arguments."""
+        await self._emit("function_call", data)
+        
+    async def _on_error(self, data: dict) -> None:
+        """Handle error."""
+        _LOGGER.error("API Error: %s", data)
+        await self._emit("error", data)
+        
+    async def _on_response_done(self, data: dict) -> None:
+        """Handle response.done."""
+        text = "".join(self._text_parts)
+        self._text_parts.clear()
+        await self._emit("response_done", {"text": text})
+        
     async def send_message(self, message: dict) -> None:
         """Send a message to the API."""
         if not self.is_connected or not self.websocket:
             _LOGGER.warning("Not connected to API")
             return
             
+        # Decoded so the API still receives a text frame; serialization
+        # errors are bugs, not a lost connection, so they aren't caught here
+        payload = orjson.dumps(message).decode()
         try:
-            await self.websocket.send(json.dumps(message))
-        except Exception as e:
-            _LOGGER.error(f"Failed to send message: {e}")
+            await self.websocket.send(payload)
+        except (WebSocketException, OSError) as e:
+            _LOGGER.error("Failed to send message: %s", e)
+            # Later sends short-circuit instead of retrying the broken socket
+            self.is_connected = False
             await self._schedule_reconnect()
             
     async def send_audio(self, audio_data: bytes) -> None:
         """Send audio data to the API."""
         # Convert audio to base64
-        audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+        audio_base64 = binascii.b2a_base64(audio_data, newline=False).decode("ascii")
         
         message = {
             "type": WS_EVENT_INPUT_AUDIO_BUFFER_APPEND,
@@ -247,20 +341,20 @@ class OpenAIRealtimeClient:
         
     async def add_context(self, role: str, content: str) -> None:
         """Add context to the conversation."""
-        self._conversation_context.append({
-            "type": "message",
-            "role": role,
-            "content": [
-                {
-                    "type": "text",
-                    "text": content
-                }
-            ]
-        })
+        self._conversation_context.append((role, content))
         
         message = {
             "type": WS_EVENT_CONVERSATION_ITEM_CREATE,
-            "item": self._conversation_context[-1]
+            "item": {
+                "type": "message",
+                "role": role,
+                "content": [
+                    {
+                        "type": "text",
+                        "text": content
+                    }
+                ]
+            }
         }
         
         await self.send_message(message)
@@ -275,6 +369,23 @@ class OpenAIRealtimeClient:
         if self.is_connected:
             await self._configure_session()
             
+    async def update_tools(self, tools: tuple[dict, ...]) -> None:
+        """Update the tools available to the model."""
+        # Tools are part of the session config sent on every (re)connect,
+        # so only an actual change needs a session.update of its own
+        if tools == self.tools:
+            return
+            
+        self.tools = tools
+        if self.is_connected:
+            await self.send_message({
+                "type": "session.update",
+                "session": {
+                    "tools": tools,
+                    "tool_choice": "auto"
+                }
+            })
+            
     async def start_session(self) -> None:
         """Start a new session."""
         if not self.is_connected:
@@ -286,6 +397,7 @@ class OpenAIRealtimeClient:
         
     async def _schedule_reconnect(self) -> None:
         """Schedule a reconnection attempt."""
+        # No await between the check and the assignment, so this is single-flight
         if self._reconnect_task and not self._reconnect_task.done():
             return
             
@@ -296,10 +408,13 @@ class OpenAIRealtimeClient:
         retry_count = 0
         max_retries = 5
         base_delay = 1
+        max_delay = 30
         
         while retry_count < max_retries and not self.is_connected:
-            delay = base_delay * (2 ** retry_count)
-            _LOGGER.info(f"Reconnecting in {delay} seconds...")
+            # Capped, with jitter so many clients don't retry in lockstep;
+            # disconnect() cancels the task, which interrupts the sleep
+            delay = min(max_delay, base_delay * (2 ** retry_count)) * (0.5 + random.random())
+            _LOGGER.info("Reconnecting in %.1f seconds...", delay)
             await asyncio.sleep(delay)
             
             try:
@@ -308,7 +423,7 @@ class OpenAIRealtimeClient:
                     _LOGGER.info("Reconnected successfully")
                     break
             except Exception as e:
-                _LOGGER.error(f"Reconnection failed: {e}")
+                _LOGGER.error("Reconnection failed: %s", e)
                 
             retry_count += 1
             
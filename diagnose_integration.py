@@ -4,6 +4,7 @@
 import os
 import sys
 import json
+from collections import deque
 
 def check_integration():
     """Check if the integration is properly installed."""
@@ -56,20 +57,21 @@ def check_integration():
     config_path = "/config/configuration.yaml"
     if os.path.exists(config_path):
         with open(config_path, 'r') as f:
-            content = f.read()
-            if "openai_realtime_assistant" in content:
-                print("   ✓ Integration found in configuration.yaml")
-                # Extract the config section
-                lines = content.split('\n')
-                in_section = False
-                for line in lines:
-                    if "openai_realtime_assistant:" in line:
-                        in_section = True
-                    elif in_section and line and not line.startswith(' '):
-                        break
-                    if in_section:
-                        print(f"     {line}")
-            else:
+            # Stream the file and print the config section as it goes by
+            found = False
+            in_section = False
+            for line in f:
+                line = line.rstrip('\n')
+                if not found and "openai_realtime_assistant" in line:
+                    found = True
+                    print("   ✓ Integration found in configuration.yaml")
+                if "openai_realtime_assistant:" in line:
+                    in_section = True
+                elif in_section and line and not line.startswith(' '):
+                    break
+                if in_section:
+                    print(f"     {line}")
+            if not found:
                 print("   - Integration not found in configuration.yaml")
                 
     # Check Home Assistant log
@@ -77,9 +79,8 @@ def check_integration():
     log_path = "/config/home-assistant.log"
     if os.path.exists(log_path):
         with open(log_path, 'r') as f:
-            lines = f.readlines()
             errors = []
-            for line in lines[-100:]:  # Last 100 lines
+            for line in deque(f, maxlen=100):  # Last 100 lines
                 if "openai_realtime_assistant" in line.lower():
                     errors.append(line.strip())
                     